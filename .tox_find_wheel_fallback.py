@@ -1,84 +1,89 @@
 #!/usr/bin/env python3
-"""Helper script to find and install wheel, with fallback to building from source."""
+"""Helper script to find and install wheel, with fallback to building from source.
+
+Wheel discovery (tag/arch detection, pattern matching over dist/) lives in
+_tox_wheel_common.py, shared with .tox_find_wheel.py.
+"""
 import glob
 import os
 import sys
 import subprocess
-import platform
+from functools import lru_cache
 
-def get_python_tag():
-    """Get Python tag for current Python version (e.g., cp38, cp312)."""
-    major, minor = sys.version_info[:2]
-    return f"cp{major}{minor}"
+from _tox_wheel_common import _fast_copy, find_wheel
 
-def get_architecture():
-    """Get current architecture."""
-    machine = platform.machine().lower()
-    if machine == 'arm64' or machine == 'aarch64':
-        return 'arm64'
-    elif machine == 'x86_64' or machine == 'amd64':
-        return 'x86_64'
-    else:
-        return machine
+@lru_cache(maxsize=1)
+def _pip_install_command():
+    """Base argv for installing into this interpreter's environment.
 
-def find_wheel():
-    """Find the best available wheel for current Python version and architecture."""
-    python_tag = get_python_tag()
-    arch = get_architecture()
-    
-    print(f"Looking for wheel: Python {sys.version_info.major}.{sys.version_info.minor} ({python_tag}), Architecture: {arch}")
-    
-    patterns = [
-        f'dist/*{python_tag}-abi3-*.whl',
-        'dist/*universal*.whl',
-        'dist/*universal2*.whl',
-        f'dist/*{python_tag}-abi3-*{arch}*.whl',
-        f'dist/*{arch}*.whl',
-        f'dist/*{python_tag}*.whl',
-        'dist/*.whl'
-    ]
-    
-    for pattern in patterns:
-        wheels = glob.glob(pattern)
-        if wheels:
-            exact_matches = [w for w in wheels if python_tag in os.path.basename(w)]
-            if exact_matches:
-                wheel = exact_matches[0]
-            else:
-                wheel = wheels[0]
-            
-            if os.path.exists(wheel):
+    Prefers uv's pip interface when uv is on PATH - it skips the Python
+    interpreter startup that a full pip invocation pays - and falls back
+    to the stock python -m pip.
+    """
+    import shutil
+    uv = shutil.which('uv')
+    if uv:
+        return [uv, 'pip', 'install', '--python', sys.executable]
+    return [sys.executable, '-m', 'pip', 'install']
+
+# Probe script run in a single child interpreter: installs and imports each
+# candidate wheel in turn, printing a flushed verdict line per wheel so the
+# parent can tell which wheel crashed the child if a segfault occurs
+_PROBE_SCRIPT = """
+import subprocess, sys
+for w in sys.argv[1:]:
+    r = subprocess.run([sys.executable, '-m', 'pip', 'install',
+                        '--force-reinstall', '--no-deps', '--quiet', w],
+                       capture_output=True)
+    if r.returncode != 0:
+        print('BAD ' + w, flush=True)
+        continue
+    from pc_ble_driver_py import config
+    config.__conn_ic_id__ = 'NRF52'
+    import pc_ble_driver_py.ble_driver
+    print('OK ' + w, flush=True)
+    sys.exit(0)
+sys.exit(1)
+"""
+
+def test_wheels_import(wheels):
+    """Return the first wheel that installs and imports without segfaulting.
+
+    All candidates are fed to one child interpreter instead of paying a
+    fork + interpreter startup per wheel; if a candidate segfaults the
+    child, a fresh child resumes with the remaining candidates.
+    """
+    pending = list(wheels)
+    while pending:
+        print(f"Testing wheel import: {os.path.basename(pending[0])}")
+        result = subprocess.run([sys.executable, '-c', _PROBE_SCRIPT, *pending],
+                                capture_output=True, text=True, timeout=60)
+        tested = []
+        for line in result.stdout.splitlines():
+            verdict, _, wheel = line.partition(' ')
+            if verdict == 'OK':
+                print(f"  ✓ Wheel import works: {os.path.basename(wheel)}")
                 return wheel
-    
+            if verdict == 'BAD':
+                print(f"  ✗ Failed to install wheel: {os.path.basename(wheel)}")
+                tested.append(wheel)
+        # No OK verdict: either every candidate failed to install, or the
+        # child died importing the first wheel after the last BAD line
+        remaining = [w for w in pending if w not in tested]
+        if remaining:
+            crashed = remaining[0]
+            print(f"  ✗ Wheel segfaults or fails to import (exit code: {result.returncode}): "
+                  f"{os.path.basename(crashed)}")
+            # Uninstall failed wheel
+            subprocess.run([sys.executable, '-m', 'pip', 'uninstall', '-y', 'pc-ble-driver-py'],
+                          capture_output=True)
+            remaining = remaining[1:]
+        pending = remaining
     return None
 
 def test_wheel_import(wheel):
     """Test if wheel can be imported without segfault."""
-    print(f"Testing wheel import: {os.path.basename(wheel)}")
-    # Install wheel temporarily
-    result = subprocess.run([
-        sys.executable, '-m', 'pip', 'install', '--force-reinstall', '--no-deps', '--quiet', wheel
-    ], capture_output=True)
-    
-    if result.returncode != 0:
-        print(f"  ✗ Failed to install wheel")
-        return False
-    
-    # Try to import
-    test_result = subprocess.run([
-        sys.executable, '-c',
-        'from pc_ble_driver_py import config; config.__conn_ic_id__ = "NRF52"; import pc_ble_driver_py.ble_driver'
-    ], capture_output=True, timeout=5)
-    
-    if test_result.returncode == 0:
-        print(f"  ✓ Wheel import works")
-        return True
-    else:
-        print(f"  ✗ Wheel segfaults or fails to import (exit code: {test_result.returncode})")
-        # Uninstall failed wheel
-        subprocess.run([sys.executable, '-m', 'pip', 'uninstall', '-y', 'pc-ble-driver-py'], 
-                      capture_output=True)
-        return False
+    return test_wheels_import([wheel]) is not None
 
 def main():
     # Check if we should skip wheel testing (for faster development)
@@ -87,9 +92,9 @@ def main():
         wheel = find_wheel()
         if wheel:
             print(f"Installing wheel: {os.path.basename(wheel)}")
-            result = subprocess.run([
-                sys.executable, '-m', 'pip', 'install', '--force-reinstall', '--no-deps', wheel
-            ])
+            result = subprocess.run(
+                _pip_install_command() + ['--force-reinstall', '--no-deps', wheel]
+            )
             return result.returncode
         else:
             print("No wheel found, building from source...")
@@ -107,22 +112,30 @@ def main():
     
     # Fall back to building from source
     print("Building from source as fallback...")
+    import shutil
+    # Parallelize the CMake build and route compiles through ccache when
+    # available so rebuilds across the tox matrix hit the cache
+    build_env = os.environ.copy()
+    build_env.setdefault('CMAKE_BUILD_PARALLEL_LEVEL', str(os.cpu_count() or 1))
+    if shutil.which('ccache'):
+        build_env.setdefault('CMAKE_C_COMPILER_LAUNCHER', 'ccache')
+        build_env.setdefault('CMAKE_CXX_COMPILER_LAUNCHER', 'ccache')
     build_result = subprocess.run([
         sys.executable, 'setup.py', 'build', '--build-type', 'Release'
-    ])
+    ], env=build_env)
     if build_result.returncode != 0:
         return build_result.returncode
     
-    # Copy libraries
-    import shutil
+    # Copy libraries (hardlink when possible - build dir and target share a filesystem)
     libs = glob.glob('_skbuild/*/cmake-install/pc_ble_driver_py/lib/*.so')
     for lib in libs:
-        shutil.copy2(lib, 'pc_ble_driver_py/lib/')
+        dest = os.path.join('pc_ble_driver_py/lib', os.path.basename(lib))
+        _fast_copy(lib, dest)
     
     # Install editable
-    install_result = subprocess.run([
-        sys.executable, '-m', 'pip', 'install', '-e', '.', '--no-build-isolation', '--no-deps'
-    ])
+    install_result = subprocess.run(
+        _pip_install_command() + ['-e', '.', '--no-build-isolation', '--no-deps']
+    )
     return install_result.returncode
 
 if __name__ == '__main__':
@@ -0,0 +1,166 @@
+"""Shared helpers for the .tox_find_wheel* scripts.
+
+Both tox helper scripts need the same wheel discovery logic (Python tag,
+architecture, priority-ordered pattern matching over dist/); keeping one
+copy here means one .pyc in __pycache__ covers both entry points and the
+two scripts cannot drift apart.
+"""
+import fnmatch
+import os
+import re
+import sys
+import platform
+from functools import lru_cache
+
+def _fast_copy(src, dst):
+    """Copy src to dst, using a hardlink when both sit on the same filesystem.
+
+    _skbuild and pc_ble_driver_py/lib normally share a filesystem, so the
+    common case is a pure metadata operation with zero bytes copied; cross-
+    device copies (EXDEV) fall back to shutil.copy2.
+    """
+    import shutil
+    try:
+        os.remove(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+# Cache of dist/ wheel filenames, keyed by the directory's mtime so repeated
+# pattern probes (and repeated find_wheel() calls) reuse a single scan
+_DIST_CACHE = {}
+
+def _dist_wheels():
+    """Return the list of wheel filenames in dist/, scanning at most once per dist/ mtime."""
+    try:
+        key = os.stat('dist').st_mtime_ns
+    except OSError:
+        return []
+    wheels = _DIST_CACHE.get(key)
+    if wheels is None:
+        wheels = [e.name for e in os.scandir('dist')
+                  if e.name.endswith('.whl') and e.is_file()]
+        _DIST_CACHE.clear()
+        _DIST_CACHE[key] = wheels
+    return wheels
+
+@lru_cache(maxsize=1)
+def get_python_tag():
+    """Get Python tag for current Python version (e.g., cp38, cp312)."""
+    major, minor = sys.version_info[:2]
+    return f"cp{major}{minor}"
+
+@lru_cache(maxsize=1)
+def get_architecture():
+    """Get current architecture."""
+    machine = platform.machine().lower()
+    if machine == 'arm64' or machine == 'aarch64':
+        return 'arm64'
+    elif machine == 'x86_64' or machine == 'amd64':
+        return 'x86_64'
+    else:
+        return machine
+
+# Compiled pattern alternations, keyed by (python_tag, arch) — translating
+# and compiling the priority list once instead of per find_wheel() call
+_PATTERN_CACHE = {}
+
+def _patterns(python_tag, arch):
+    """Yield wheel filename patterns for a tag/arch pair in priority order."""
+    # Priority order:
+    # 1. Bundled wheel (preferred - self-contained)
+    # 2. Exact match: cpXX-abi3-*_arch.whl (e.g., cp312-abi3-*_arm64.whl)
+    # 3. For abi3 wheels, also check cp38 (abi3 wheels use cp38 tag for Python 3.8+)
+    # 4. Universal2 wheel (if available)
+    # 5. Any wheel with matching architecture
+    # 6. Any wheel
+
+    # Bundled wheel (preferred) - look for exact Python version first
+    yield f'dist/*{python_tag}-abi3-*{arch}*_bundled.whl'
+    yield f'dist/*{python_tag}-abi3-*_bundled.whl'
+    # Exact match for this Python version (wheels are renamed to preserve Python version)
+    # Even though they're tagged cp38-abi3 internally, the filename includes the build Python version
+    yield f'dist/*{python_tag}-abi3-*.whl'
+    # For abi3 wheels, also check cp38 (abi3 wheels use cp38 tag internally,
+    # but we prefer wheels built with - and renamed for - the matching version)
+    # Note: This will find wheels that weren't renamed, but we prefer version-specific ones
+    if int(python_tag.replace('cp', '')) >= 38:
+        yield 'dist/*cp38-abi3-*.whl'
+    # Universal2 wheel (works on both architectures)
+    yield 'dist/*universal*.whl'
+    yield 'dist/*universal2*.whl'
+    # Architecture-specific wheel with Python tag
+    yield f'dist/*{python_tag}-abi3-*{arch}*.whl'
+    # Architecture-specific wheel (any Python version)
+    yield f'dist/*{arch}*.whl'
+    # Any wheel with Python tag
+    yield f'dist/*{python_tag}*.whl'
+    # Any wheel
+    yield 'dist/*.whl'
+
+def _pattern_cache_path(python_tag, arch):
+    """On-disk location for the pickled pattern regex of one tag/arch pair."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), '__pycache__',
+                        f'pat.{python_tag}.{arch}.pkl')
+
+def _compiled_patterns(python_tag, arch):
+    """Return (pattern_count, regex) matching any pattern via one named-group alternation.
+
+    The compiled regex is also pickled into __pycache__ (re.Pattern pickles
+    since 3.7), so the many short-lived interpreters of a tox matrix reload
+    it instead of re-translating and re-compiling the pattern list.
+    """
+    cached = _PATTERN_CACHE.get((python_tag, arch))
+    if cached is None:
+        import pickle
+        cache_path = _pattern_cache_path(python_tag, arch)
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception:
+            parts = [
+                f'(?P<g{i}>{fnmatch.translate(os.path.basename(p))})'
+                for i, p in enumerate(_patterns(python_tag, arch))
+            ]
+            cached = (len(parts), re.compile('|'.join(parts)))
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                tmp_path = cache_path + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(cached, f)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass  # Cache is best-effort only
+        _PATTERN_CACHE[(python_tag, arch)] = cached
+    return cached
+
+def find_wheel():
+    """Find the best available wheel for current Python version and architecture."""
+    python_tag = get_python_tag()
+    arch = get_architecture()
+
+    print(f"Looking for wheel: Python {sys.version_info.major}.{sys.version_info.minor} ({python_tag}), Architecture: {arch}")
+
+    # Scan dist/ once and run every filename through a single compiled
+    # alternation; the named group that matched recovers the priority tier
+    npatterns, regex = _compiled_patterns(python_tag, arch)
+    tiers = [[] for _ in range(npatterns)]
+    for name in _dist_wheels():
+        m = regex.match(name)
+        if m:
+            for i in range(npatterns):
+                if m.group(f'g{i}') is not None:
+                    tiers[i].append(name)
+                    break
+
+    for wheels in tiers:
+        if wheels:
+            # Prefer exact Python version match
+            exact_matches = [w for w in wheels if python_tag in w]
+            wheel = exact_matches[0] if exact_matches else wheels[0]
+            return os.path.join('dist', wheel)
+
+    return None
@@ -10,81 +10,157 @@ import zipfile
 import tempfile
 import os
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
+def _load_dylib_names(so_path):
+    """Return the dylib install names linked by a Mach-O file, or None.
+
+    Walks the LC_LOAD_DYLIB / LC_LOAD_WEAK_DYLIB load commands of a thin
+    64-bit Mach-O file with struct - the same information otool -L prints,
+    without spawning a process. Returns None for anything unparseable so
+    the caller can fall back to otool.
+    """
+    import struct
+    LC_LOAD_DYLIB = 0x0C
+    LC_LOAD_WEAK_DYLIB = 0x18
+    try:
+        with open(so_path, 'rb') as f:
+            header = f.read(32)
+            if len(header) < 32:
+                return None
+            if struct.unpack('<I', header[:4])[0] != 0xFEEDFACF:
+                return None
+            ncmds, sizeofcmds = struct.unpack('<II', header[16:24])
+            cmds = f.read(sizeofcmds)
+    except OSError:
+        return None
+    names = []
+    offset = 0
+    for _ in range(ncmds):
+        if offset + 8 > len(cmds):
+            return None
+        cmd, cmdsize = struct.unpack_from('<II', cmds, offset)
+        if cmdsize < 8 or offset + cmdsize > len(cmds):
+            return None
+        if cmd in (LC_LOAD_DYLIB, LC_LOAD_WEAK_DYLIB):
+            name_offset = struct.unpack_from('<I', cmds, offset + 8)[0]
+            raw = cmds[offset + name_offset:offset + cmdsize]
+            names.append(raw.split(b'\x00', 1)[0].decode('utf-8', 'replace'))
+        offset += cmdsize
+    return names
+
+@lru_cache(maxsize=256)
+def _cached_dylib_names(so_path, mtime_ns, size):
+    """Memoized _load_dylib_names; the stat fields key out stale entries."""
+    return _load_dylib_names(so_path)
+
 def fix_so_file(so_path):
     """Fix .so file to use @rpath/Python instead of version-specific library."""
-    # Check current dependencies
-    result = subprocess.run(
-        ['otool', '-L', so_path],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-    
-    changes_needed = []
-    for line in result.stdout.split('\n'):
-        if '@rpath/libpython' in line and '.dylib' in line:
-            # Extract the old reference
-            old_ref = line.strip().split()[0]
-            # Change to framework style
-            new_ref = '@rpath/Python'
-            changes_needed.append((old_ref, new_ref))
-    
-    # Apply changes
-    for old_ref, new_ref in changes_needed:
-        print(f"  Changing {old_ref} -> {new_ref}")
-        subprocess.run(
-            ['install_name_tool', '-change', old_ref, new_ref, so_path],
+    # Check current dependencies - parsed in-process; otool is only
+    # spawned for files the parser can't handle (e.g. fat binaries)
+    try:
+        st = os.stat(so_path)
+        names = _cached_dylib_names(so_path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        names = None
+    if names is None:
+        result = subprocess.run(
+            ['otool', '-L', so_path],
+            capture_output=True,
+            text=True,
             check=True
         )
-    
+        names = [line.strip().split()[0]
+                 for line in result.stdout.split('\n')[1:] if line.strip()]
+
+    changes_needed = []
+    for name in names:
+        if '@rpath/libpython' in name and '.dylib' in name:
+            # Change to framework style
+            changes_needed.append((name, '@rpath/Python'))
+
+    # Apply all changes with a single install_name_tool invocation - the
+    # tool accepts repeated -change flags and also re-signs the binary,
+    # which a raw in-place byte patch would not
+    if changes_needed:
+        argv = ['install_name_tool']
+        for old_ref, new_ref in changes_needed:
+            print(f"  Changing {old_ref} -> {new_ref}")
+            argv += ['-change', old_ref, new_ref]
+        subprocess.run(argv + [so_path], check=True)
+
     return len(changes_needed) > 0
 
+def _set_deflate_level(zi, compresslevel):
+    """Carry the requested deflate level on a member's ZipInfo.
+
+    ZipFile.open(zi, 'w') takes its level from zi._compresslevel - None
+    on parsed infos, which means zlib's default 6 - and ignores the
+    archive-wide compresslevel, so it has to be set per member.
+    """
+    if zi.compress_type == zipfile.ZIP_DEFLATED:
+        zi._compresslevel = compresslevel
+    return zi
+
 def fix_wheel(wheel_path):
     """Fix wheel to work with all Python versions."""
     print(f"Processing wheel: {wheel_path}")
-    
-    # Create temporary directory
+
+    # Only the .so files are ever modified, so extract just those and
+    # stream every other member from the old archive to the new one
+    # instead of materializing the whole wheel on disk twice
     with tempfile.TemporaryDirectory() as temp_dir:
-        # Extract wheel
-        print("Extracting wheel...")
-        with zipfile.ZipFile(wheel_path, 'r') as z:
-            z.extractall(temp_dir)
-        
-        # Find and fix .so files
-        so_files = list(Path(temp_dir).rglob('*.so'))
-        print(f"Found {len(so_files)} .so files")
-        
-        fixed_any = False
-        for so_file in so_files:
-            print(f"\nFixing {so_file.relative_to(temp_dir)}...")
-            if fix_so_file(str(so_file)):
-                fixed_any = True
-        
-        if not fixed_any:
-            print("\nNo changes needed (already using @rpath/Python or no Python dependencies)")
-            return
-        
-        # Recreate wheel
-        print(f"\nRecreating wheel...")
-        output_path = Path(wheel_path)
-        backup_path = output_path.with_suffix('.whl.backup')
-        
-        # Backup original
-        if output_path.exists():
+        # A megabyte read buffer cuts the syscall count over the wheel's
+        # many small members (default buffering is 8 KB)
+        with open(wheel_path, 'rb', buffering=1 << 20) as raw_src, \
+             zipfile.ZipFile(raw_src, 'r') as src:
+            so_infos = [zi for zi in src.infolist() if zi.filename.endswith('.so')]
+            print(f"Found {len(so_infos)} .so files")
+
+            fixed = {}
+            for zi in so_infos:
+                print(f"\nFixing {zi.filename}...")
+                so_path = src.extract(zi, temp_dir)
+                if fix_so_file(so_path):
+                    fixed[zi.filename] = so_path
+
+            if not fixed:
+                print("\nNo changes needed (already using @rpath/Python or no Python dependencies)")
+                return
+
+            # Recreate wheel
+            print(f"\nRecreating wheel...")
+            output_path = Path(wheel_path)
+            backup_path = output_path.with_suffix('.whl.backup')
+
+            # Backup original
             import shutil
             shutil.copy2(output_path, backup_path)
             print(f"Backed up original to {backup_path}")
-        
-        # Create new wheel
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as z:
-            for root, dirs, files in os.walk(temp_dir):
-                for file in files:
-                    file_path = Path(root) / file
-                    arc_name = file_path.relative_to(temp_dir)
-                    z.write(file_path, arc_name)
-        
+
+            # Splice the patched .so files into a streamed copy of the
+            # original archive; untouched members keep their metadata and
+            # compress_type since the writer reuses their ZipInfo
+            tmp_path = f"{wheel_path}.tmp"
+            # Level 1 deflate: members are mostly copied verbatim, and the
+            # few recompressed ones don't justify zlib's default level 6
+            compresslevel = int(os.getenv('PC_BLE_WHEEL_COMPRESSLEVEL', '1'))
+            with open(tmp_path, 'wb', buffering=1 << 20) as raw_dst, \
+                 zipfile.ZipFile(raw_dst, 'w', zipfile.ZIP_DEFLATED,
+                                 compresslevel=compresslevel,
+                                 allowZip64=True) as dst:
+                for zi in src.infolist():
+                    _set_deflate_level(zi, compresslevel)
+                    patched = fixed.get(zi.filename)
+                    if patched is not None:
+                        with open(patched, 'rb') as s, dst.open(zi, 'w') as d:
+                            shutil.copyfileobj(s, d, 1 << 20)
+                    else:
+                        with src.open(zi, 'r') as s, dst.open(zi, 'w') as d:
+                            shutil.copyfileobj(s, d, 1 << 20)
+            os.replace(tmp_path, output_path)
+
         print(f"✓ Fixed wheel: {output_path}")
 
 if __name__ == '__main__':
@@ -1,55 +1,103 @@
 #!/usr/bin/env python3
 """List all available wheels in a GitHub release"""
+import operator
+import re
 import sys
 import json
 import urllib.request
 
+# Wheel filename layout: dist-version-pytag-abitag-platform.whl; the first
+# four dash-separated fields are what gets printed
+_WHEEL_RE = re.compile(r'^(?P<dist>[^-]+)-(?P<ver>[^-]+)-(?P<py>[^-]+)-(?P<plat>[^-]+)')
+
+def _fetch_json(url, timeout=30):
+    """GET a GitHub API URL with an ETag disk cache.
+
+    The last response body and its ETag are stored under the system temp
+    dir; when GitHub answers 304 the cached body is reused, so repeated
+    invocations against an unchanged release transfer nothing. Responses
+    are requested gzip-compressed, which cuts the JSON payload ~5x.
+    """
+    import gzip
+    import hashlib
+    import os
+    import tempfile
+
+    key = hashlib.sha256(url.encode()).hexdigest()[:16]
+    cache_path = os.path.join(tempfile.gettempdir(), f'gh-release-{key}.json')
+    etag_path = f'{cache_path}.etag'
+    headers = {'Accept-Encoding': 'gzip'}
+    try:
+        with open(etag_path) as f:
+            headers['If-None-Match'] = f.read().strip()
+    except OSError:
+        pass
+
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            body = response.read()
+            if response.headers.get('Content-Encoding') == 'gzip':
+                body = gzip.decompress(body)
+            etag = response.headers.get('ETag')
+            if etag:
+                try:
+                    with open(cache_path, 'wb') as f:
+                        f.write(body)
+                    with open(etag_path, 'w') as f:
+                        f.write(etag)
+                except OSError:
+                    pass  # Cache is best-effort only
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise
+        with open(cache_path, 'rb') as f:
+            body = f.read()
+    return json.loads(body)
+
 def list_wheels(tag='v0.17.11'):
     url = f"https://api.github.com/repos/kimalive/pc-ble-driver-py/releases/tags/{tag}"
-    
+
     try:
-        with urllib.request.urlopen(url) as response:
-            data = json.loads(response.read())
-            
+        data = _fetch_json(url)
+
         print(f"Release: {data.get('name', tag)}")
         print(f"Tag: {tag}")
         print(f"Published: {data.get('published_at', 'Unknown')}")
         print()
         
+        # Unpack each asset dict once up front; the loops below then work
+        # on plain tuples instead of repeating dict lookups per field
         assets = data.get('assets', [])
-        wheels = [a for a in assets if a['name'].endswith('.whl')]
-        
+        wheels = [(a['name'], a['browser_download_url'], a['size'])
+                  for a in assets if a['name'].endswith('.whl')]
+
         if not wheels:
             print("No wheels found in this release.")
             return
-        
+
+        wheels.sort(key=operator.itemgetter(0))
+
         print(f"Available wheels ({len(wheels)}):")
         print()
-        
-        for wheel in sorted(wheels, key=lambda x: x['name']):
-            name = wheel['name']
-            download_url = wheel['browser_download_url']
-            size_mb = wheel['size'] / (1024 * 1024)
-            
+
+        for name, download_url, size in wheels:
+            size_mb = size / (1024 * 1024)
+
             # Parse wheel name
-            parts = name.replace('.whl', '').split('-')
-            if len(parts) >= 4:
-                version = parts[1]
-                python_tag = parts[2]
-                platform = parts[3]
-                
+            m = _WHEEL_RE.match(name)
+            if m:
                 print(f"  {name}")
-                print(f"    Version: {version}")
-                print(f"    Python: {python_tag}")
-                print(f"    Platform: {platform}")
+                print(f"    Version: {m.group('ver')}")
+                print(f"    Python: {m.group('py')}")
+                print(f"    Platform: {m.group('plat')}")
                 print(f"    Size: {size_mb:.2f} MB")
                 print(f"    URL: {download_url}")
                 print()
-        
+
         print("\nInstallation examples:")
         print("=" * 70)
-        for wheel in wheels[:3]:  # Show first 3 as examples
-            download_url = wheel['browser_download_url']
+        for _, download_url, _ in wheels[:3]:  # Show first 3 as examples
             print(f"pip install {download_url}")
         
     except urllib.error.HTTPError as e:
@@ -59,10 +107,9 @@ def list_wheels(tag='v0.17.11'):
             print(f"\nRelease {tag} not found. Available releases:")
             try:
                 releases_url = "https://api.github.com/repos/kimalive/pc-ble-driver-py/releases"
-                with urllib.request.urlopen(releases_url) as r:
-                    releases = json.loads(r.read())
-                    for release in releases[:5]:
-                        print(f"  - {release['tag_name']}: {release.get('name', 'No name')}")
+                releases = _fetch_json(releases_url)
+                for release in releases[:5]:
+                    print(f"  - {release['tag_name']}: {release.get('name', 'No name')}")
             except:
                 pass
     except Exception as e:
@@ -0,0 +1,3 @@
+"""
+Build-time tooling for pc_ble_driver_py wheels (not used at runtime).
+"""
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Post-build hook to bundle nrf-ble-driver dependencies into wheels.
+This is called after wheel is built to add dependencies.
+"""
+import os
+import subprocess
+import sys
+import shutil
+import zipfile
+import tempfile
+
+# Invariant kwargs for the Mach-O tool spawns: capture only where the
+# output is actually inspected, discard it otherwise (no pipe setup), and
+# hand the children a minimal environment so they skip locale loading
+_TOOL_ENV = {'LC_ALL': 'C', 'PATH': os.environ.get('PATH', '')}
+
+# Deflate level for members we have to recompress: level 1 runs several
+# times faster than zlib's default 6 for a marginal size difference on
+# wheel content. CI can override, e.g. 0 for fastest possible repacks
+_COMPRESSLEVEL = int(os.getenv('PC_BLE_WHEEL_COMPRESSLEVEL', '1'))
+_QUIET = dict(stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=_TOOL_ENV)
+_CAPTURE = dict(capture_output=True, text=True, env=_TOOL_ENV)
+
+VCPKG_ROOT = os.getenv('VCPKG_ROOT', '/Users/kbalive/Devel/OpenSource/vcpkg')
+# Determine architecture from VCPKG_ROOT or environment
+# Default to arm64-osx for local builds, but allow override via VCPKG_TRIPLET
+VCPKG_TRIPLET = os.getenv('VCPKG_TRIPLET', 'arm64-osx')
+VCPKG_LIB_DIR = f"{VCPKG_ROOT}/installed/{VCPKG_TRIPLET}/lib"
+
+def _set_deflate_level(zi, compresslevel):
+    """Carry the requested deflate level on a member's ZipInfo.
+
+    ZipFile.open(zi, 'w') takes its level from zi._compresslevel - None
+    on parsed infos, which means zlib's default 6 - and ignores the
+    archive-wide compresslevel, so it has to be set per member.
+    """
+    if zi.compress_type == zipfile.ZIP_DEFLATED:
+        zi._compresslevel = compresslevel
+    return zi
+
+def _scratch_dir(wheel_path):
+    """Return (path, persistent) scratch directory for staging wheel members.
+
+    With PC_BLE_WHEEL_CACHE set, the directory is keyed by the wheel's path
+    and mtime and survives the process, so tools that run back-to-back on
+    the same wheel (bundle, then fix_wheel_python_version) can reuse
+    already-materialized files instead of re-extracting. Without it, a
+    throwaway tempdir is returned and the caller cleans it up.
+    """
+    cache_root = os.getenv('PC_BLE_WHEEL_CACHE')
+    if cache_root:
+        import hashlib
+        try:
+            mtime = os.stat(wheel_path).st_mtime_ns
+        except OSError:
+            mtime = 0
+        key = hashlib.sha256(
+            f'{os.path.abspath(wheel_path)}:{mtime}'.encode()
+        ).hexdigest()[:16]
+        path = os.path.join(cache_root, key)
+        os.makedirs(path, exist_ok=True)
+        return path, True
+    return tempfile.mkdtemp(), False
+
+def bundle_dependencies(wheel_path):
+    """Bundle nrf-ble-driver dependencies into a wheel."""
+    if not os.path.exists(wheel_path):
+        return False
+
+    # Static builds and non-macOS wheels have nothing to bundle; decide
+    # that from the environment and the wheel tag before touching the
+    # archive at all
+    if os.getenv('PC_BLE_STATIC_LINK') == '1':
+        print("Skipping bundling (PC_BLE_STATIC_LINK=1, statically linked)")
+        return True
+    if 'macosx' not in os.path.basename(wheel_path):
+        print(f"Skipping bundling (not a macOS wheel): {os.path.basename(wheel_path)}")
+        return True
+
+    if not os.path.exists(VCPKG_LIB_DIR):
+        print(f"⚠️  VCPKG_LIB_DIR not found: {VCPKG_LIB_DIR}")
+        print("   Skipping bundling (wheels may not work without vcpkg libraries)")
+        return False
+    
+    print(f"Bundling dependencies into: {os.path.basename(wheel_path)}")
+    
+    # Libraries to bundle
+    libs_to_bundle = [
+        "libnrf-ble-driver-sd_api_v2.4.1.4.dylib",
+        "libnrf-ble-driver-sd_api_v5.4.1.4.dylib",
+    ]
+    
+    # Check which libraries exist - one directory snapshot instead of a
+    # stat per candidate, which also keeps the list stable if a file
+    # disappears between the check and the copy
+    with os.scandir(VCPKG_LIB_DIR) as it:
+        present = {e.name: e.path for e in it if e.is_file(follow_symlinks=False)}
+    existing_libs = []
+    for lib in libs_to_bundle:
+        if lib in present:
+            existing_libs.append((lib, present[lib]))
+        else:
+            print(f"  ⚠️  {lib} not found (may not be needed)")
+    
+    if not existing_libs:
+        print("  ⚠️  No libraries to bundle (using static linking)")
+        return False
+    
+    # Stage only what actually needs patching: the bundled dylibs and the
+    # .so files - everything else streams straight from the old wheel to
+    # the new one without touching the filesystem
+    temp_dir, persistent = _scratch_dir(wheel_path)
+    try:
+        # Create deps directory
+        deps_dir = os.path.join(temp_dir, 'deps')
+        os.makedirs(deps_dir, exist_ok=True)
+
+        # Copy libraries and fix their install_name
+        bundled = False
+        bundled_names = {lib_name for lib_name, _ in existing_libs}
+        # Each library is copied and patched independently, and the work is
+        # dominated by subprocess spawns + dylib I/O, so overlap the
+        # per-library patching across a small thread pool
+        if len(existing_libs) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(8, len(existing_libs))) as executor:
+                outcomes = list(executor.map(
+                    lambda item: _patch_one_lib(item[0], item[1], deps_dir, bundled_names),
+                    existing_libs))
+        else:
+            outcomes = [_patch_one_lib(lib_name, lib_path, deps_dir, bundled_names)
+                        for lib_name, lib_path in existing_libs]
+        for lines in outcomes:
+            for line in lines:
+                print(line)
+            bundled = True
+        
+        if not bundled:
+            return False
+
+        # No backup copy needed: the rewrite goes to a .tmp path and is
+        # swapped in atomically, so the original wheel survives any failure.
+        # Its size is recorded here for the summary line
+        old_size = os.path.getsize(wheel_path) / (1024 * 1024)
+
+        # Stream the wheel to a new archive: extract only the .so files
+        # (which need an rpath fix), copy every other member straight
+        # through, and append the patched dylibs at the end
+        # Megabyte buffers on both archive streams: wheels hold hundreds
+        # of small members, and the default 8 KB buffer means a syscall
+        # per handful of them
+        new_path = f"{wheel_path}.tmp"
+        with open(wheel_path, 'rb', buffering=1 << 20) as raw_src, \
+             open(new_path, 'wb', buffering=1 << 20) as raw_dst, \
+             zipfile.ZipFile(raw_src, 'r') as src, \
+             zipfile.ZipFile(raw_dst, 'w', zipfile.ZIP_DEFLATED,
+                             compresslevel=_COMPRESSLEVEL) as dst:
+            # Materialize all .so members up front so their rpath check
+            # runs as one batched otool -l, then patch only those lacking
+            # the deps rpath
+            infos = src.infolist()
+            patched = {
+                zi.filename: src.extract(zi, temp_dir)
+                for zi in infos
+                if (zi.filename.startswith('pc_ble_driver_py/lib/')
+                    and zi.filename.endswith('.so')
+                    and '/deps/' not in zi.filename)
+            }
+            _fix_so_rpaths(list(patched.values()))
+            for zi in infos:
+                _set_deflate_level(zi, _COMPRESSLEVEL)
+                so_path = patched.get(zi.filename)
+                if so_path is not None:
+                    # Re-add under the original ZipInfo so permissions and
+                    # timestamps survive the round-trip (extract() does
+                    # not preserve them on disk)
+                    with open(so_path, 'rb') as s, dst.open(zi, 'w') as d:
+                        shutil.copyfileobj(s, d, 1 << 20)
+                else:
+                    with src.open(zi, 'r') as s, dst.open(zi, 'w') as d:
+                        shutil.copyfileobj(s, d, 1 << 20)
+            for lib_name, _ in existing_libs:
+                # Native dylibs barely deflate, so compressing them is pure
+                # CPU burn - store them uncompressed. Members copied from
+                # the source wheel keep their original compress_type
+                lib_dest = os.path.join(deps_dir, lib_name)
+                zi = zipfile.ZipInfo.from_file(
+                    lib_dest, f'pc_ble_driver_py/lib/deps/{lib_name}')
+                zi.compress_type = zipfile.ZIP_STORED
+                with open(lib_dest, 'rb') as s, dst.open(zi, 'w') as d:
+                    shutil.copyfileobj(s, d, 1 << 20)
+        os.replace(new_path, wheel_path)
+
+        # Calculate size
+        new_size = os.path.getsize(wheel_path) / (1024 * 1024)
+        print(f"  ✓ Bundled wheel: {old_size:.1f}MB → {new_size:.1f}MB")
+        return True
+
+    finally:
+        if not persistent:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+def _patch_one_lib(lib_name, lib_path, deps_dir, bundled_names):
+    """Copy one dylib into deps/ and rewrite its install names.
+
+    Returns the status lines to print; they are emitted by the caller so
+    output doesn't interleave when libraries are patched concurrently.
+    """
+    lines = []
+    dest = os.path.join(deps_dir, lib_name)
+    # copyfile uses the platform's zero-copy path (fcopyfile on macOS,
+    # copy_file_range on Linux); copy2 would force an extra metadata
+    # read-back we don't need beyond the mode bits
+    shutil.copyfile(lib_path, dest)
+    shutil.copymode(lib_path, dest)
+
+    # One otool -L up front discovers every dependency that still
+    # references the original vcpkg path; the -id rewrite and all
+    # -change rewrites are then applied in a single
+    # install_name_tool invocation (the tool accepts repeated flags)
+    changes = []
+    deps_result = subprocess.run(['otool', '-L', dest], **_CAPTURE)
+    if deps_result.returncode == 0:
+        for line in deps_result.stdout.split('\n')[1:]:  # Skip first line (the library itself)
+            if VCPKG_LIB_DIR in line:
+                dep_path = line.split()[0] if line.strip() else None
+                if dep_path and os.path.basename(dep_path) in bundled_names:
+                    dep_name = os.path.basename(dep_path)
+                    changes += ['-change', dep_path, f'@loader_path/{dep_name}']
+
+    # CRITICAL: Fix install_name to use @loader_path instead of @rpath
+    # This ensures the library can be found when loaded from deps/
+    # Note: @loader_path refers to the .so file that loads it, which is in lib/
+    # So @loader_path/deps/ will resolve to lib/deps/ where the library is
+    result = subprocess.run(
+        ['install_name_tool', '-id', f'@loader_path/deps/{lib_name}', *changes, dest],
+        **_CAPTURE
+    )
+    if result.returncode != 0:
+        lines.append(f"  ⚠️  Warning: Could not fix install_name for {lib_name}: {result.stderr}")
+        # Try alternative: use @rpath but ensure rpath is set correctly
+        result2 = subprocess.run(
+            ['install_name_tool', '-id', f'@rpath/{lib_name}', *changes, dest],
+            **_QUIET
+        )
+        if result2.returncode == 0:
+            lines.append(f"  ✓ Bundled with @rpath install_name: {lib_name}")
+        else:
+            lines.append(f"  ⚠️  Failed to set install_name for {lib_name}")
+    else:
+        lines.append(f"  ✓ Bundled and fixed install_name to @loader_path/deps/: {lib_name}")
+    return lines
+
+def _fix_so_rpaths(so_paths):
+    """Add @loader_path/deps to the extension modules that lack it.
+
+    A single otool -l invocation covers every file (its output prints one
+    "<path>:" header per input); only the files missing the rpath then
+    pay an install_name_tool spawn.
+    """
+    if not so_paths:
+        return
+    rpath_result = subprocess.run(['otool', '-l', *so_paths], **_CAPTURE)
+    blocks = {}
+    if rpath_result.returncode == 0:
+        current = None
+        for line in rpath_result.stdout.split('\n'):
+            if line.endswith(':') and not line.startswith((' ', '\t')):
+                # Fat binaries print one "<path> (architecture ...):"
+                # header per slice; merge them under the bare path
+                current = line[:-1].split(' (architecture')[0]
+                blocks.setdefault(current, [])
+            elif current is not None:
+                blocks[current].append(line)
+    for so_path in so_paths:
+        so_name = os.path.basename(so_path)
+        if '@loader_path/deps' not in '\n'.join(blocks.get(so_path, [])):
+            result = subprocess.run(
+                ['install_name_tool', '-add_rpath', '@loader_path/deps', so_path],
+                **_CAPTURE
+            )
+            if result.returncode == 0:
+                print(f"  ✓ Updated rpath in {so_name}")
+            else:
+                print(f"  ⚠️  Warning: Could not add rpath to {so_name}: {result.stderr}")
+        else:
+            print(f"  ✓ rpath already set in {so_name}")
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: bundle_into_wheel.py <wheel_file>")
+        sys.exit(1)
+    
+    wheel_path = sys.argv[1]
+    if bundle_dependencies(wheel_path):
+        print("✓ Bundling complete")
+        sys.exit(0)
+    else:
+        print("⚠️  Bundling skipped or failed")
+        sys.exit(1)
@@ -36,33 +36,52 @@
 #
 import sys
 import re
-import codecs
+import functools
 import os
-import platform
-# Ensure scikit-build sees a valid platform name on macOS before import
+import shutil
+
+# Ensure scikit-build sees a valid platform name on macOS before import;
+# explicit env from CI takes precedence over the derived default. All of
+# the platform probing and patching lives inside this guard so Linux and
+# Windows builds never import platform or touch it at all.
 if sys.platform == "darwin":
-    # Prefer explicit env from CI; otherwise set a safe default based on arch
-    arch = platform.machine()
-    arch = "arm64" if arch == "arm64" else "x86_64"
-    plat = os.environ.get("_SKBUILD_PLAT_NAME") or os.environ.get("SKBUILD_PLAT_NAME") or f"macosx-11.0-{arch}"
+    import platform
+
+    @functools.lru_cache(maxsize=1)
+    def _mac_plat_tag():
+        """Default scikit-build platform tag for this machine.
+
+        Cached so the mac_ver/machine probes (which read sysctl) run at
+        most once however many times the metadata is evaluated.
+        """
+        ver = platform.mac_ver()[0] or "11.0"
+        parts = ver.split(".")
+        minor = parts[1] if len(parts) > 1 else "0"
+        arch = "arm64" if platform.machine() == "arm64" else "x86_64"
+        return f"macosx-{parts[0]}.{minor}-{arch}"
+
+    plat = os.environ.get("_SKBUILD_PLAT_NAME") or os.environ.get("SKBUILD_PLAT_NAME") or _mac_plat_tag()
     os.environ["SKBUILD_PLAT_NAME"] = plat
     os.environ["_SKBUILD_PLAT_NAME"] = plat
-    # Patch platform.release() to return X.Y (some macOS return only X)
-    try:
-        _orig_release = platform.release
-        def _safe_release():
-            rel = _orig_release()
-            return rel if "." in rel else f"{rel}.0"
-        platform.release = _safe_release
-    except Exception:
-        pass
-    # Debug: print what Python reports (before importing skbuild)
+
+    # Patch platform.release() to return X.Y (some macOS return only X).
+    # skbuild calls release() repeatedly during its import chain, so the
+    # fixed string is computed once here instead of re-split per call
+    _release = platform.release()
+    _release_fixed = _release if "." in _release else f"{_release}.0"
+    platform.release = lambda: _release_fixed
+
+    # skbuild.constants computes its module-level _SKBUILD_PLAT_NAME by
+    # calling _default_skbuild_plat_name() at import time (the code path
+    # with the macOS 15 single-component release bug), so patching the
+    # hook afterwards is too late - push the already-resolved tag in
+    # through the supported setter instead
     try:
-        print(f"DEBUG setup.py: sys.platform={sys.platform}", file=sys.stderr)
-        print(f"DEBUG setup.py: platform.release()={platform.release()}", file=sys.stderr)
-        print(f"DEBUG setup.py: platform.mac_ver()={platform.mac_ver()}", file=sys.stderr)
-        print(f"DEBUG setup.py: SKBUILD_PLAT_NAME={os.environ.get('SKBUILD_PLAT_NAME')}", file=sys.stderr)
-        print(f"DEBUG setup.py: _SKBUILD_PLAT_NAME={os.environ.get('_SKBUILD_PLAT_NAME')}", file=sys.stderr)
+        import skbuild.constants as _skbuild_constants
+        try:
+            _skbuild_constants.set_skbuild_plat_name(plat)
+        except AttributeError:
+            _skbuild_constants._SKBUILD_PLAT_NAME = plat
     except Exception:
         pass
 
@@ -91,26 +110,63 @@ if os.path.exists("MANIFEST"):
 
 here = os.path.abspath(os.path.dirname(__file__))
 
+_VERSION_RE = re.compile(r"^__version__ = ['\"]([^'\"]*)['\"]", re.M)
 
+
+@functools.lru_cache(maxsize=None)
 def read(*parts):
-    # intentionally *not* adding an encoding option to open, See:
-    #   https://github.com/pypa/virtualenv/issues/201#issuecomment-3145690
-    with codecs.open(os.path.join(here, *parts), "r") as fp:
+    # Cached: PEP 517 metadata probes evaluate this file repeatedly, and
+    # neither the README nor the version string changes between probes.
+    with open(os.path.join(here, *parts), encoding="utf-8") as fp:
         return fp.read()
 
 
+@functools.lru_cache(maxsize=None)
 def find_version(*file_paths):
-    version_file = read(*file_paths)
-    version_match = re.search(
-        r"^__version__ = ['\"]([^'\"]*)['\"]", version_file, re.M,
-    )
+    # __version__ sits near the top of the module, so reading the first
+    # block is enough - no need to pull the whole file through the regex
+    with open(os.path.join(here, *file_paths), encoding="utf-8") as fp:
+        head = fp.read(4096)
+    version_match = _VERSION_RE.search(head)
     if version_match:
         return version_match.group(1)
 
     raise RuntimeError("Unable to find version string.")
 
 
-packages = find_packages(exclude=["tests*"])
+# find_packages walks the whole source tree stat-ing for __init__.py on
+# every metadata probe; the package set is static, so it is spelled out
+# here. Set PC_BLE_DRIVER_PY_REGEN=1 to fall back to discovery (useful
+# for checking this list after adding a package).
+PACKAGES = (
+    "pc_ble_driver_py",
+    "pc_ble_driver_py._build",
+    "pc_ble_driver_py.examples",
+    "pc_ble_driver_py.hex",
+    "pc_ble_driver_py.hex.sd_api_v2",
+    "pc_ble_driver_py.hex.sd_api_v5",
+    "pc_ble_driver_py.lib",
+)
+
+if os.environ.get("PC_BLE_DRIVER_PY_REGEN") == "1":
+    packages = find_packages(exclude=["tests*"])
+else:
+    packages = list(PACKAGES)
+
+# Let cmake --build fan out across all cores unless the caller already
+# pinned a level; without this the underlying Make generator serializes
+# the whole native build
+os.environ.setdefault("CMAKE_BUILD_PARALLEL_LEVEL", str(os.cpu_count() or 2))
+
+# Route the native build through ccache when available: the driver
+# sources are identical across the whole Python-version matrix (only the
+# binding link stage differs), so rebuilds hit the cache almost entirely
+cmake_args = []
+if shutil.which("ccache"):
+    cmake_args += [
+        "-DCMAKE_C_COMPILER_LAUNCHER=ccache",
+        "-DCMAKE_CXX_COMPILER_LAUNCHER=ccache",
+    ]
 
 setup(
     name="pc_ble_driver_py",
@@ -147,6 +203,7 @@ setup(
     python_requires=">=3.7",
     install_requires=requirements,
     packages=packages,
+    cmake_args=cmake_args,
     package_data={
         "pc_ble_driver_py.lib": ["*.pyd", "*.dll", "*.txt", "*.so", "*.dylib"],
         "pc_ble_driver_py.hex": ["*.hex"],
@@ -0,0 +1,52 @@
+"""
+Single source of truth for the test-file lists used by the runners.
+
+run_all_tests.py and run_tests_simple.py used to hardcode overlapping
+copies of these lists; keeping them here means new tests get picked up
+by both runners in one edit. The containers are immutable on purpose -
+tuples for ordered iteration and a read-only mapping for the
+descriptions.
+"""
+from types import MappingProxyType
+
+# Test files that don't require hardware
+SOFTWARE_TESTS = (
+    'test_wheel_compatibility.py',
+    'test_cmake_rpath_config.py',
+    'test_pc_ble_driver_py.py',
+    'test_wheel_compresslevel.py',
+)
+
+# Test files that require hardware (skipped by the runners)
+HARDWARE_TESTS = (
+    'test_driver_open_close.py',
+    'test_programming.py',
+    'test_ble_common_api.py',
+    'test_rssi.py',
+    'test_connection_update.py',
+    'test_mtu.py',
+    'test_data_length.py',
+    'test_server_client.py',
+    'test_passkey.py',
+    'test_lesc_security.py',
+    'test_phy_update.py',
+)
+
+DESCRIPTIONS = MappingProxyType({
+    'test_wheel_compatibility.py': {
+        'description': 'Tests wheel compatibility: imports, @rpath usage, Python version compatibility',
+        'requires_hardware': False,
+    },
+    'test_cmake_rpath_config.py': {
+        'description': 'Verifies CMake rpath configuration is correct',
+        'requires_hardware': False,
+    },
+    'test_pc_ble_driver_py.py': {
+        'description': 'Tests basic package structure and imports',
+        'requires_hardware': False,
+    },
+    'test_wheel_compresslevel.py': {
+        'description': 'Verifies the wheel rewriters honor PC_BLE_WHEEL_COMPRESSLEVEL',
+        'requires_hardware': False,
+    },
+})
@@ -9,13 +9,57 @@ This script:
 3. Falls back to environment variables if provided
 4. Skips gracefully if no hardware is found
 """
+import hashlib
+import json
 import os
 import sys
 import subprocess
 import glob
 import platform
+import time
 from pathlib import Path
 
+# Port detection is expensive (importing BLEDriver loads a large native
+# library before USB enumeration even starts) and the tox matrix reruns
+# this script once per Python version within seconds. The detected list
+# is cached on disk for a short TTL, keyed on a fingerprint of /dev so
+# plugging or unplugging a device invalidates it immediately.
+_PORT_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'pc_ble_driver_py', 'ports.json')
+_PORT_CACHE_TTL = 60  # seconds
+
+def _dev_topology_key():
+    """Fingerprint of the /dev listing; changes when devices come or go."""
+    try:
+        return hashlib.md5(str(sorted(os.listdir('/dev'))).encode()).hexdigest()
+    except OSError:
+        return None
+
+def _read_port_cache(key):
+    """Return the cached port list if it is fresh and matches key, else None."""
+    if key is None:
+        return None
+    try:
+        with open(_PORT_CACHE_PATH) as f:
+            data = json.load(f)
+        if data['key'] == key and time.time() - data['timestamp'] < _PORT_CACHE_TTL:
+            return data['ports']
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+def _write_port_cache(key, ports):
+    if key is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(_PORT_CACHE_PATH), exist_ok=True)
+        tmp_path = f'{_PORT_CACHE_PATH}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'key': key, 'timestamp': time.time(), 'ports': ports}, f)
+        os.replace(tmp_path, _PORT_CACHE_PATH)
+    except OSError:
+        pass  # Cache is best-effort only
+
 def find_system_serial_ports():
     """
     Fallback: Find serial ports by checking system /dev directory.
@@ -56,10 +100,24 @@ def find_available_ports():
     """
     Automatically detect available Nordic serial ports.
     Returns list of port strings, or empty list if none found.
+    Results are shared across sibling tox envs via a short-TTL disk cache.
+    """
+    key = _dev_topology_key()
+    cached = _read_port_cache(key)
+    if cached is not None:
+        print(f"  Using cached port list ({len(cached)} port(s), detected <{_PORT_CACHE_TTL}s ago)")
+        return cached
+
+    ports = _enumerate_ports()
+    _write_port_cache(key, ports)
+    return ports
+
+def _enumerate_ports():
+    """
     Uses dual detection: BLEDriver.enum_serial_ports() + system port fallback.
     """
     ports_found = []
-    
+
     # Method 1: Try BLEDriver.enum_serial_ports() (most reliable)
     try:
         # Set config before importing BLEDriver
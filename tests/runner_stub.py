@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Run several test files inside one interpreter and report JSON results.
+
+Used by the test runners for the x86_64 (Rosetta) pass: launching a
+subprocess per test file pays the Rosetta translation cold-start for
+every test, while this stub pays it once per slice. Each test file is
+executed with runpy as if it were run directly; the final stdout line
+is a JSON mapping of test path to 'passed' or 'failed'.
+"""
+import json
+import runpy
+import sys
+
+
+def main():
+    results = {}
+    for test_path in sys.argv[1:]:
+        try:
+            runpy.run_path(test_path, run_name='__main__')
+            results[test_path] = 'passed'
+        except SystemExit as e:
+            code = e.code
+            results[test_path] = 'passed' if code in (0, None) else 'failed'
+        except Exception:
+            results[test_path] = 'failed'
+    print(json.dumps(results))
+
+
+if __name__ == '__main__':
+    main()
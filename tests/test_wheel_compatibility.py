@@ -12,37 +12,108 @@ Usage:
 """
 import sys
 import os
-import platform
-import subprocess
-import argparse
+import signal
+import time
 from pathlib import Path
 
+# argparse, platform and subprocess are imported lazily inside the
+# functions that need them: they pull in a fair chunk of the stdlib and
+# none of them are required just to import (or collect) this module
+
 # CRITICAL: Remove source directory from sys.path to ensure we import from installed wheel
 # This prevents Python from finding the source directory's pc_ble_driver_py before the installed wheel
 if '__file__' in globals():
     # Get the project root (parent of tests directory)
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     source_pkg = os.path.join(project_root, 'pc_ble_driver_py')
-    # Remove source directory from sys.path if it exists and is not the installed package
-    if source_pkg in sys.path:
-        sys.path.remove(source_pkg)
-    # Also remove current directory if it's the project root
-    if project_root in sys.path and os.path.exists(os.path.join(project_root, 'pc_ble_driver_py', '__init__.py')):
+    # Strip the source directory (and the project root when it contains
+    # the source package) in one pass; a set filter also drops duplicate
+    # entries, which the old in/remove pairs missed
+    _strip = {source_pkg}
+    if os.path.exists(os.path.join(project_root, 'pc_ble_driver_py', '__init__.py')):
+        _strip.add(project_root)
+    sys.path[:] = [p for p in sys.path if p not in _strip]
+
+
+# First successful import of the package is remembered here so
+# check_library_paths can reuse the module object instead of running
+# the import machinery a second time
+_state = {'pkg': None}
+
+
+def _probe_import_forked(timeout=10):
+    """Attempt the ble_driver import in a forked child.
+
+    A segfault only kills the child, and fork skips the full interpreter
+    startup (site init, encodings, argv parsing) that a sys.executable
+    subprocess pays just to run four import statements. The child
+    reports through its exit status: 0 imported, 2 ImportError (package
+    not installed), 1 any other failure. Returns the raw waitpid status,
+    or None on timeout (child is killed).
+    """
+    pid = os.fork()
+    if pid == 0:
+        # Child: communicate via exit status only; printing from a
+        # forked child can interleave badly with the parent's buffers
         try:
-            sys.path.remove(project_root)
-        except ValueError:
-            pass
+            from pc_ble_driver_py import config
+            config.__conn_ic_id__ = 'NRF52'
+            import pc_ble_driver_py.ble_driver  # noqa: F401
+        except ImportError:
+            os._exit(2)
+        except Exception:
+            os._exit(1)
+        os._exit(0)
+
+    deadline = time.monotonic() + timeout
+    while True:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done == pid:
+            return status
+        if time.monotonic() > deadline:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            return None
+        time.sleep(0.05)
 
 
 def check_import():
     """Test basic import functionality."""
+    import subprocess
     print("Testing basic import...")
     try:
         # Set config before importing ble_driver to avoid RuntimeError
         from pc_ble_driver_py import config
         config.__conn_ic_id__ = 'NRF52'
-        
-        # CRITICAL: Run import in subprocess to catch segfaults (exit code -11)
+        _state['pkg'] = sys.modules.get('pc_ble_driver_py')
+
+        # CRITICAL: Run the import in a separate process to catch
+        # segfaults - they kill the process before Python can catch
+        # exceptions. On POSIX a fork is enough and avoids interpreter
+        # cold start entirely.
+        if hasattr(os, 'fork'):
+            status = _probe_import_forked()
+            if status is None:
+                print("✗ Import test timed out (possible hang)")
+                return False
+            if os.WIFSIGNALED(status):
+                term_sig = os.WTERMSIG(status)
+                if term_sig == signal.SIGSEGV:
+                    print("✗ Import caused segfault (SIGSEGV)")
+                else:
+                    print(f"✗ Import killed by signal {term_sig}")
+                return False
+            exit_code = os.WEXITSTATUS(status)
+            if exit_code == 2:
+                print("⚠ Import failed: package not importable")
+                return True  # Not a failure, just can't test without package
+            if exit_code != 0:
+                print(f"✗ Import failed with exit code {exit_code}")
+                return False
+            print("✓ Import successful")
+            return True
+
+        # Windows fallback: no fork, spawn a fresh interpreter (exit code -11)
         # Segfaults kill the process before Python can catch exceptions
         # By running in a subprocess, we can detect the exit code
         import_code = """
@@ -94,27 +165,118 @@ except Exception as e:
         print("✗ Import test timed out (possible hang)")
         return False
     except Exception as e:
-        print(f"✗ Import test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        # repr carries the exception type; the full traceback (and the
+        # linecache/tokenize imports it drags in) is opt-in via DEBUG
+        print(f"✗ Import test failed: {e!r}")
+        if os.environ.get('DEBUG'):
+            import traceback
+            traceback.print_exc()
         return False
 
 
+def _load_dylib_names(so_path):
+    """Return the dylib install names linked by a Mach-O file, or None.
+
+    Walks the LC_LOAD_DYLIB / LC_LOAD_WEAK_DYLIB load commands of a thin
+    64-bit Mach-O file with struct - the same information otool -L
+    prints, without spawning a process. Returns None for anything
+    unparseable (e.g. fat binaries) so the caller can fall back to otool.
+    """
+    import struct
+    LC_LOAD_DYLIB = 0x0C
+    LC_LOAD_WEAK_DYLIB = 0x18
+    try:
+        with open(so_path, 'rb') as f:
+            header = f.read(32)
+            if len(header) < 32:
+                return None
+            if struct.unpack('<I', header[:4])[0] != 0xFEEDFACF:
+                return None
+            ncmds, sizeofcmds = struct.unpack('<II', header[16:24])
+            cmds = f.read(sizeofcmds)
+    except OSError:
+        return None
+    names = []
+    offset = 0
+    for _ in range(ncmds):
+        if offset + 8 > len(cmds):
+            return None
+        cmd, cmdsize = struct.unpack_from('<II', cmds, offset)
+        if cmdsize < 8 or offset + cmdsize > len(cmds):
+            return None
+        if cmd in (LC_LOAD_DYLIB, LC_LOAD_WEAK_DYLIB):
+            name_offset = struct.unpack_from('<I', cmds, offset + 8)[0]
+            raw = cmds[offset + name_offset:offset + cmdsize]
+            names.append(raw.split(b'\x00', 1)[0].decode('utf-8', 'replace'))
+        offset += cmdsize
+    return names
+
+
+def _check_so_dependencies(so_file, dep_lines):
+    """Validate one .so file's dependency lines (otool -L body lines).
+
+    Returns False when a hardcoded Python library path is found.
+    """
+    has_hardcoded_path = False
+    has_loader_path = False
+
+    for line in dep_lines:
+        # Extract the library path (before the first space); partition
+        # avoids building a list of every whitespace-split token
+        lib_path = line.partition(' ')[0]
+
+        # Skip the file itself (otool repeats the file path for dylibs)
+        if lib_path == str(so_file) or lib_path.endswith(so_file.name):
+            continue
+
+        # Only check Python library dependencies, not the .so file path itself
+        if 'libpython' in lib_path or (lib_path.endswith('/Python') and 'Python.framework' in lib_path):
+            # Check for hardcoded paths (absolute paths that don't use @loader_path)
+            if not lib_path.startswith('@') and '/' in lib_path:
+                print(f"    ✗ Hardcoded path found: {lib_path}")
+                has_hardcoded_path = True
+                # One hardcoded path already fails this file; no need to
+                # scan the rest of its dependencies
+                break
+            # Check for @loader_path usage (the portable approach)
+            elif '@loader_path' in lib_path:
+                print(f"    ✓ Using @loader_path for Python library: {lib_path}")
+                has_loader_path = True
+            # Check for other @-prefixed paths (should be changed to @loader_path)
+            elif lib_path.startswith('@') and '@loader_path' not in lib_path:
+                print(f"    ⚠️  Using {lib_path} (should be @loader_path for maximum portability)")
+                # Not a failure, but not ideal
+
+    if has_hardcoded_path:
+        print(f"    ✗ {so_file.name} has hardcoded Python library paths")
+        return False
+    elif has_loader_path:
+        print(f"    ✓ {so_file.name} uses @loader_path (portable) correctly")
+    else:
+        print(f"    ? {so_file.name} - no Python library dependencies found")
+    return True
+
+
 def check_library_paths():
     """Check that native libraries use @loader_path instead of hardcoded paths."""
+    import platform
+    import subprocess
     if platform.system() != 'Darwin':
         print("Skipping library path check (not macOS)")
         return True
     
     print("\nChecking library dependency paths...")
     try:
-        try:
-            import pc_ble_driver_py.config
-        except ImportError:
-            print("⚠ Package not installed - cannot check library paths")
-            print("  Install a wheel first to test library paths")
-            return True  # Not a failure, just can't test
-        
+        pc_ble_driver_py = _state['pkg']
+        if pc_ble_driver_py is None:
+            try:
+                import pc_ble_driver_py
+            except ImportError:
+                print("⚠ Package not installed - cannot check library paths")
+                print("  Install a wheel first to test library paths")
+                return True  # Not a failure, just can't test
+            _state['pkg'] = pc_ble_driver_py
+
         # Check if __file__ is None (namespace package or not installed)
         if pc_ble_driver_py.__file__ is None:
             print("⚠ Package __file__ is None - cannot check library paths")
@@ -128,109 +290,96 @@ def check_library_paths():
             print(f"✗ Library directory not found: {lib_dir}")
             return False
         
-        so_files = list(lib_dir.glob('*.so'))
+        so_files = tuple(lib_dir.glob('*.so'))
         if not so_files:
             print(f"✗ No .so files found in {lib_dir}")
             return False
         
-        all_good = True
+        # Read the LC_LOAD_DYLIB load commands in-process first; only
+        # files the parser can't handle (e.g. fat binaries) fall back to
+        # otool, batched into one invocation for all of them
+        blocks = {}
+        need_otool = []
         for so_file in so_files:
-            print(f"\n  Checking {so_file.name}...")
+            names = _load_dylib_names(str(so_file))
+            if names is None:
+                need_otool.append(so_file)
+            else:
+                blocks[str(so_file)] = names
+
+        if need_otool:
             try:
-                # Use otool to check dependencies
                 result = subprocess.run(
-                    ['otool', '-L', str(so_file)],
+                    ['otool', '-L', *map(str, need_otool)],
                     capture_output=True,
                     text=True,
                     check=True
                 )
-                
-                lines = result.stdout.strip().split('\n')
-                if len(lines) < 2:
-                    print(f"    ✗ No dependencies found")
-                    all_good = False
-                    continue
-                
-                # Check each dependency
-                has_hardcoded_path = False
-                has_loader_path = False
-                python_lib_found = False
-                
-                for line in lines[1:]:  # Skip first line (the file itself)
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    # Extract the library path (before the first space)
-                    lib_path = line.split()[0]
-                    
-                    # Skip the file itself (first line shows the file path)
-                    if lib_path == str(so_file) or lib_path.endswith(so_file.name):
-                        continue
-                    
-                    # Only check Python library dependencies, not the .so file path itself
-                    if 'libpython' in lib_path or (lib_path.endswith('/Python') and 'Python.framework' in lib_path):
-                        python_lib_found = True
-                        # Check for hardcoded paths (absolute paths that don't use @loader_path)
-                        if not lib_path.startswith('@') and '/' in lib_path:
-                            print(f"    ✗ Hardcoded path found: {lib_path}")
-                            has_hardcoded_path = True
-                            all_good = False
-                        # Check for @loader_path usage (the portable approach)
-                        elif '@loader_path' in lib_path:
-                            print(f"    ✓ Using @loader_path for Python library: {lib_path}")
-                            has_loader_path = True
-                        # Check for other @-prefixed paths (should be changed to @loader_path)
-                        elif lib_path.startswith('@') and '@loader_path' not in lib_path:
-                            print(f"    ⚠️  Using {lib_path} (should be @loader_path for maximum portability)")
-                            # Not a failure, but not ideal
-                
-                if has_hardcoded_path:
-                    print(f"    ✗ {so_file.name} has hardcoded Python library paths")
-                elif has_loader_path:
-                    print(f"    ✓ {so_file.name} uses @loader_path (portable) correctly")
-                else:
-                    print(f"    ? {so_file.name} - no Python library dependencies found")
-                    
-            except subprocess.CalledProcessError as e:
+            except (subprocess.CalledProcessError, FileNotFoundError) as e:
                 print(f"    ✗ Failed to check dependencies: {e}")
+                return False
+
+            # otool prints a '<path>:' header before each file's block;
+            # fat binaries repeat it as '<path> (architecture x86_64):'
+            # per slice, so strip the suffix and merge slices
+            current = None
+            for line in result.stdout.splitlines():
+                if line and not line[0].isspace() and line.rstrip().endswith(':'):
+                    current = line.rstrip()[:-1].split(' (architecture')[0]
+                    blocks.setdefault(current, [])
+                elif current is not None and line.strip():
+                    blocks[current].append(line.strip())
+
+        all_good = True
+        for so_file in so_files:
+            print(f"\n  Checking {so_file.name}...")
+            dep_lines = blocks.get(str(so_file), [])
+            if not dep_lines:
+                print(f"    ✗ No dependencies found")
                 all_good = False
-            except Exception as e:
-                print(f"    ✗ Error checking {so_file.name}: {e}")
+                continue
+            if not _check_so_dependencies(so_file, dep_lines):
                 all_good = False
-        
+
         return all_good
         
     except Exception as e:
-        print(f"✗ Error checking library paths: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"✗ Error checking library paths: {e!r}")
+        if os.environ.get('DEBUG'):
+            import traceback
+            traceback.print_exc()
         return False
 
 
 def check_python_info():
     """Display Python installation information."""
+    import platform
     print("\nPython installation information:")
     print(f"  Version: {sys.version}")
     print(f"  Executable: {sys.executable}")
     print(f"  Platform: {platform.platform()}")
     
-    # Try to detect Python installation type
+    # Try to detect Python installation type; first matching marker
+    # wins, so Cellar (a definite Homebrew sign) sits above the generic
+    # prefixes it lives under
     python_exe = sys.executable
-    if '/Library/Frameworks/Python.framework' in python_exe:
-        print("  Type: Python.org framework installation")
-    elif '/opt/homebrew' in python_exe or '/usr/local' in python_exe:
-        if 'Cellar' in python_exe:
-            print("  Type: Homebrew installation")
-        else:
-            print("  Type: Possibly Homebrew or custom installation")
-    elif '.pyenv' in python_exe:
-        print("  Type: pyenv installation")
+    for marker, label in (
+        ('/Library/Frameworks/Python.framework', 'Python.org framework installation'),
+        ('Cellar', 'Homebrew installation'),
+        ('/opt/homebrew', 'Possibly Homebrew or custom installation'),
+        ('/usr/local', 'Possibly Homebrew or custom installation'),
+        ('.pyenv', 'pyenv installation'),
+    ):
+        if marker in python_exe:
+            print(f"  Type: {label}")
+            break
     else:
         print("  Type: Unknown/Custom installation")
 
 
 def main():
+    import argparse
+    import subprocess
     parser = argparse.ArgumentParser(
         description='Test wheel compatibility with different Python installations'
     )
@@ -250,15 +399,21 @@ def main():
     # Install wheel if provided
     if args.wheel_path:
         print(f"Installing wheel from {args.wheel_path}...")
+        install_args = ['install', '--force-reinstall', '--no-deps', args.wheel_path]
         try:
-            subprocess.run(
-                [sys.executable, '-m', 'pip', 'install', '--force-reinstall', '--no-deps', args.wheel_path],
-                check=True
-            )
-            print("✓ Wheel installed")
-        except subprocess.CalledProcessError as e:
-            print(f"✗ Failed to install wheel: {e}")
+            # Running pip in-process skips a full interpreter + pip
+            # startup; the entry point is private but stable, and the
+            # subprocess form remains as the fallback
+            from pip._internal.cli.main import main as pip_main
+            rc = pip_main(install_args)
+        except ImportError:
+            rc = subprocess.run(
+                [sys.executable, '-m', 'pip'] + install_args
+            ).returncode
+        if rc != 0:
+            print(f"✗ Failed to install wheel (exit code {rc})")
             return 1
+        print("✓ Wheel installed")
     
     # Check Python version
     if args.python_version:
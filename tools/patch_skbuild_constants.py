@@ -1,21 +1,30 @@
 #!/usr/bin/env python3
 import sys
 import os
-import sysconfig
 import re
 
+# Preserve indentation of the matched line
+_TARGET_RE = re.compile(
+    r'^([ \t]*)major_macos,\s*minor_macos\s*=\s*release\.split\("."\)\[:2\]\s*$',
+    flags=re.MULTILINE,
+)
+
 def main() -> int:
-    pure = sysconfig.get_paths().get("purelib") or ""
+    # Imported here so merely importing this module from a wrapper stays
+    # cheap; get_path("purelib") asks for the one key we need instead of
+    # building the full scheme dict
+    import sysconfig
+    pure = sysconfig.get_path("purelib") or ""
     path = os.path.join(pure, "skbuild", "constants.py")
-    print(f"[patch_skbuild] constants.py: {path} {'(exists)' if os.path.isfile(path) else '(missing)'}")
-    if not os.path.isfile(path):
+    exists = os.path.isfile(path)
+    print(f"[patch_skbuild] constants.py: {path} {'(exists)' if exists else '(missing)'}")
+    if not exists:
         return 0
     try:
         with open(path, "r", encoding="utf-8") as f:
             src = f.read()
-        # Preserve indentation of the matched line
-        pattern = r'^([ \t]*)major_macos,\s*minor_macos\s*=\s*release\.split\("."\)\[:2\]\s*$'
-        m = re.search(pattern, src, flags=re.MULTILINE)
+        m = _TARGET_RE.search(src)
+        head_src = src
         if m:
             indent = m.group(1)
             replacement = (
@@ -24,18 +33,21 @@ def main() -> int:
                 f'{indent}    release = f"{{parts[0]}}.0" if parts else "15.0"\n'
                 f'{indent}major_macos, minor_macos = release.split(".")[:2]\n'
             )
-            dst = re.sub(pattern, replacement, src, count=1, flags=re.MULTILINE)
+            # Splice at the match spans; re.sub would rescan the whole
+            # source a second time just to find the same match
+            dst = src[:m.start()] + replacement + src[m.end():]
             if dst != src:
                 with open(path, "w", encoding="utf-8") as f:
                     f.write(dst)
+                head_src = dst
                 print("[patch_skbuild] ✓ Patched constants.py (indent preserved)")
             else:
                 print("[patch_skbuild] constants.py unchanged (regex no-op)")
         else:
             print("[patch_skbuild] Pattern not found; no change made")
-        # show head for diagnostics
-        with open(path, "r", encoding="utf-8") as f:
-            head = "".join(list(f.readlines()[:30]))
+        # show head for diagnostics - the content is already in memory,
+        # no need to re-read the file
+        head = "\n".join(head_src.splitlines()[:30])
         print("[patch_skbuild] --- head ---\n" + head)
     except Exception as e:
         print(f"[patch_skbuild] Error: {e}")